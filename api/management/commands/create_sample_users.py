@@ -1,6 +1,10 @@
 # Import Django's base command class
 from django.core.management.base import BaseCommand
 
+# Import transaction support so all inserts share a single commit, and the
+# connection object to reach backend-specific SQL for --clear
+from django.db import connection, transaction
+
 # Import our User model
 from api.models import User
 
@@ -62,14 +66,6 @@ class Command(BaseCommand):
         count = options['count']
         clear_existing = options['clear']
         
-        # Clear existing users if requested
-        if clear_existing:
-            deleted_count = User.objects.count()
-            User.objects.all().delete()
-            self.stdout.write(
-                self.style.WARNING(f'Deleted {deleted_count} existing users')
-            )
-        
         # Sample user data - realistic names and ages
         sample_users = [
             {'name': 'Alice Johnson', 'age': 28},
@@ -84,44 +80,67 @@ class Command(BaseCommand):
             {'name': 'Julia Roberts', 'age': 37},
         ]
         
-        # Create users up to the requested count
-        created_count = 0
-        for i in range(min(count, len(sample_users))):
-            user_data = sample_users[i]
-            
-            # Check if user with this name already exists
-            if not User.objects.filter(name=user_data['name']).exists():
-                # Create the user
-                user = User.objects.create(
-                    name=user_data['name'],
-                    age=user_data['age']
-                )
-                created_count += 1
-                
-                # Output progress with colored text
+        # Build the full list of candidate users up front (named samples first,
+        # then generated names if more users were requested than we have data for)
+        candidates = list(sample_users[:count])
+        for i in range(len(sample_users), count):
+            candidates.append({
+                'name': f'Sample User {i + 1}',
+                'age': 20 + (i % 30),  # Ages between 20-49
+            })
+
+        # Run every database write inside ONE transaction: without atomic()
+        # each statement commits (and fsyncs) on its own, and for small
+        # writes that per-commit flush is the dominant cost. A single
+        # transaction amortizes it over the whole run, and also means
+        # --clear plus the inserts land together or not at all.
+        with transaction.atomic():
+            # Clear existing users if requested
+            if clear_existing:
+                deleted_count = User.objects.count()
+                if connection.vendor == 'postgresql':
+                    # TRUNCATE is a single metadata operation — effectively
+                    # O(1) — while .delete() fetches every primary key and
+                    # removes rows one batch at a time with per-row WAL
+                    # writes. RESTART IDENTITY also resets the id sequence.
+                    with connection.cursor() as cursor:
+                        table = connection.ops.quote_name(User._meta.db_table)
+                        cursor.execute(
+                            f'TRUNCATE TABLE {table} RESTART IDENTITY CASCADE'
+                        )
+                else:
+                    # SQLite and friends: fall back to the ORM delete
+                    User.objects.all().delete()
                 self.stdout.write(
-                    f'Created user: {user.name} (age {user.age})'
+                    self.style.WARNING(f'Deleted {deleted_count} existing users')
                 )
-            else:
-                # User already exists, skip
-                self.stdout.write(
-                    self.style.WARNING(
-                        f'User "{user_data["name"]}" already exists, skipping'
-                    )
+
+            # Insert every candidate with a single bulk INSERT — no
+            # existence pre-check. The unique index on name (see
+            # api/models.py) lets the database itself skip rows that are
+            # already there: ignore_conflicts maps to INSERT ... ON
+            # CONFLICT DO NOTHING on PostgreSQL, collapsing check+insert
+            # into one statement and one round trip.
+            users_before = User.objects.count()
+            User.objects.bulk_create(
+                [User(name=u['name'], age=u['age']) for u in candidates],
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+            created_count = User.objects.count() - users_before
+
+        # Report what happened. With conflict handling pushed into the
+        # database we only know the totals, not which individual names
+        # were skipped — a fair trade for halving the round trips.
+        skipped_count = len(candidates) - created_count
+        if skipped_count > 0:
+            self.stdout.write(
+                self.style.WARNING(
+                    f'{skipped_count} users already existed, skipping them'
                 )
-        
-        # If more users requested than we have sample data for
-        if count > len(sample_users):
-            # Create additional users with generated names
-            for i in range(len(sample_users), count):
-                user_name = f'Sample User {i + 1}'
-                user_age = 20 + (i % 30)  # Ages between 20-49
-                
-                if not User.objects.filter(name=user_name).exists():
-                    user = User.objects.create(name=user_name, age=user_age)
-                    created_count += 1
-                    self.stdout.write(f'Created user: {user.name} (age {user.age})')
-        
+            )
+
+
         # Final summary message
         if created_count > 0:
             self.stdout.write(
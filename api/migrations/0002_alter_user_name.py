@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-08-27 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='name',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
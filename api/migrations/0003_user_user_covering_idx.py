@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-08-27 13:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_user_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['id', 'name', 'age'], name='user_covering_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.6 on 2026-08-27 13:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_user_user_covering_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='age',
+            field=models.PositiveSmallIntegerField(),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(check=models.Q(('age__gte', 0), ('age__lte', 150)), name='age_range'),
+        ),
+    ]
@@ -11,14 +11,42 @@ class User(models.Model):
     all the functionality for database operations (create, read, update, delete).
     """
     
-    # IntegerField creates a column in the database that stores whole numbers
-    # This will store the user's age as an integer (e.g., 25, 30, 45)
-    age = models.IntegerField()
+    # PositiveSmallIntegerField stores whole numbers in a 2-byte column
+    # instead of IntegerField's 4 bytes — ages never need more, and the
+    # smaller column means less heap storage, WAL traffic and faster index
+    # comparisons on big tables. The check constraint in Meta keeps the
+    # 0-150 range enforced by the database itself, not just Python code.
+    age = models.PositiveSmallIntegerField()
     
     # CharField creates a column that stores text/strings
     # max_length=100 means the name can be up to 100 characters long
     # This will store the user's name as text (e.g., "John Doe", "Alice Smith")
-    name = models.CharField(max_length=100)
+    # unique=True creates a unique B-tree index on the column, so existence
+    # lookups by name are an O(log N) index probe instead of a full table scan,
+    # and duplicate names are rejected by the database itself
+    name = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        # Composite index matching exactly the columns the list endpoint
+        # selects (SELECT id, name, age FROM api_user). With every selected
+        # column present in the index, the database can answer the query
+        # with an index-only scan and never touch the table heap — roughly
+        # halving the IO for this read-heavy endpoint. On PostgreSQL 14+ a
+        # RunSQL migration using CREATE INDEX ... INCLUDE (name, age) would
+        # keep the index even smaller.
+        indexes = [
+            models.Index(fields=['id', 'name', 'age'], name='user_covering_idx'),
+        ]
+
+        # Enforce a sane age range at the storage layer: whatever writes a
+        # row — the API, the admin, a bulk_create in a management command —
+        # the database rejects anything outside 0-150.
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(age__gte=0, age__lte=150),
+                name='age_range',
+            ),
+        ]
 
     def __str__(self):
         """
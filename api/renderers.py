@@ -0,0 +1,33 @@
+# Import orjson - a Rust-backed JSON encoder that is several times faster
+# than the stdlib json module and writes bytes directly
+import orjson
+
+# Import DRF's renderer base class
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson instead of the stdlib json module.
+
+    DRF's default JSONRenderer builds an intermediate Python string and
+    then encodes it to bytes; orjson serializes straight to bytes in one
+    pass and benchmarks ~3-5x faster. Once the database and serializer
+    costs are squeezed, JSON encoding dominates the CPU time of a large
+    list response, so this is where the remaining cycles go.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+
+    # orjson already produces UTF-8 bytes, so there is nothing to encode —
+    # charset=None tells DRF to use the payload as-is
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Serialize `data` to a JSON byte string."""
+        if data is None:
+            return b''
+        # default=str covers the occasional non-native type (Decimal,
+        # lazy translation strings) the same way DRF's encoder would
+        return orjson.dumps(data, default=str)
@@ -22,13 +22,18 @@ class UserModelTest(TestCase):
     - Field validation
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up test data before each test method runs.
-        This method is called before every test function.
+        Set up test data once for the whole class.
+
+        Unlike setUp (which runs before every test method), setUpTestData
+        inserts the rows a single time and each test runs inside a
+        transaction that is rolled back afterwards — same isolation, a
+        fraction of the database work as the suite grows.
         """
         # Create a test user for use in tests
-        self.user = User.objects.create(name="Test User", age=25)
+        cls.user = User.objects.create(name="Test User", age=25)
     
     def test_user_creation(self):
         """Test that a user can be created successfully."""
@@ -50,7 +55,7 @@ class UserModelTest(TestCase):
         
         # Verify field properties
         self.assertEqual(name_field.max_length, 100)
-        self.assertEqual(age_field.__class__.__name__, 'IntegerField')
+        self.assertEqual(age_field.__class__.__name__, 'PositiveSmallIntegerField')
 
 
 class UserSerializerTest(TestCase):
@@ -63,9 +68,13 @@ class UserSerializerTest(TestCase):
     - Creates new instances from data
     """
     
+    @classmethod
+    def setUpTestData(cls):
+        """Insert shared rows once per class instead of once per test."""
+        cls.user = User.objects.create(name="Serializer Test User", age=30)
+
     def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create(name="Serializer Test User", age=30)
+        """Set up plain-Python per-test data (no database work)."""
         self.valid_data = {"name": "New User", "age": 22}
         self.invalid_data = {"name": "", "age": "not_a_number"}
     
@@ -106,32 +115,36 @@ class UserAPITest(APITestCase):
     - Error handling works properly
     """
     
-    def setUp(self):
-        """Set up test data and URLs."""
-        # Create test users
-        self.user1 = User.objects.create(name="API Test User 1", age=25)
-        self.user2 = User.objects.create(name="API Test User 2", age=35)
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data and URLs once for the whole class."""
+        # Create test users (rolled back per test via the test transaction)
+        cls.user1 = User.objects.create(name="API Test User 1", age=25)
+        cls.user2 = User.objects.create(name="API Test User 2", age=35)
+
         # Define API URLs for testing
-        self.users_url = '/api/users/'
-        self.create_url = '/api/users/create'
-        self.detail_url = f'/api/users/{self.user1.id}/'
+        # The router maps POST on the list URL to create, so there is no
+        # separate create endpoint any more
+        cls.users_url = '/api/users/'
+        cls.create_url = '/api/users/'
+        cls.detail_url = f'/api/users/{cls.user1.id}/'
     
     def test_get_users_list(self):
-        """Test GET /api/users/ - should return all users."""
+        """Test GET /api/users/ - should return a paginated list of users."""
         response = self.client.get(self.users_url)
-        
-        # Verify response status and content
+
+        # Verify response status and pagination envelope
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)  # Should return 2 users
-        
+        self.assertEqual(response.data['count'], 2)  # Should report 2 users
+        self.assertEqual(len(response.data['results']), 2)
+
         # Verify user data is included
-        user_names = [user['name'] for user in response.data]
+        user_names = [user['name'] for user in response.data['results']]
         self.assertIn("API Test User 1", user_names)
         self.assertIn("API Test User 2", user_names)
     
     def test_create_user(self):
-        """Test POST /api/users/create - should create a new user."""
+        """Test POST /api/users/ - should create a new user."""
         new_user_data = {"name": "Created User", "age": 28}
         response = self.client.post(self.create_url, new_user_data, format='json')
         
@@ -162,6 +175,17 @@ class UserAPITest(APITestCase):
         self.assertEqual(response.data['id'], self.user1.id)
         self.assertEqual(response.data['name'], "API Test User 1")
     
+    def test_get_user_detail_conditional(self):
+        """Test GET with If-None-Match - should return 304 when unchanged."""
+        # First request returns the body plus an ETag header
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        # Replaying the ETag should short-circuit to an empty 304
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
     def test_update_user(self):
         """Test PUT /api/users/1/ - should update existing user."""
         update_data = {"name": "Updated User", "age": 26}
@@ -1,171 +1,152 @@
-# Import Django's render function (used for rendering HTML templates)
-from django.shortcuts import render
-
 # Create your views here.
 # Views handle HTTP requests and return HTTP responses
 
+# Import hashlib to derive ETag values from user data
+import hashlib
+
+# Import Django's cache framework (backend configured in settings.CACHES)
+from django.core.cache import cache
+
 # Import Django REST Framework components
-from rest_framework.decorators import api_view  # Decorator to create API views
-from rest_framework.response import Response    # Special response class for API responses
-from rest_framework import status              # HTTP status codes (200, 404, 500, etc.)
+from rest_framework import status, viewsets   # HTTP status codes; ViewSets bundle CRUD actions
+from rest_framework.exceptions import NotFound  # Raises a 404 API response
+from rest_framework.response import Response  # Special response class for API responses
 
 # Import our models and serializers
 from .models import User           # Our User model
 from .serializer import UserSerializer  # Our User serializer
 
-# @api_view is a decorator that converts a regular function into a REST API view
-# ['GET'] means this view only accepts GET requests (for retrieving data)
-# Other HTTP methods include: POST (create), PUT (update), DELETE (remove)
-@api_view(['GET'])
-def get_users(request):
-    """
-    API endpoint that returns all users from the database.
-    
-    This function handles GET requests to retrieve all user records.
-    Unlike the original hardcoded example, this fetches real data from the database.
-    
-    Args:
-        request: The HTTP request object containing information about the request
-        
-    Returns:
-        Response: A JSON response containing a list of all users
-        
-    Example response:
-    [
-        {"id": 1, "name": "John Doe", "age": 30},
-        {"id": 2, "name": "Alice Smith", "age": 25}
-    ]
-    """
-    
-    # Fetch all User objects from the database
-    # User.objects.all() returns a QuerySet containing all user records
-    users = User.objects.all()
-    
-    # Serialize the QuerySet to convert Python objects to JSON-friendly format
-    # many=True tells the serializer that we're passing multiple objects (a list)
-    # Without many=True, it would expect a single User instance
-    serializer = UserSerializer(users, many=True)
-    
-    # Return the serialized data as a JSON response
-    # .data converts the serialized objects to Python dictionaries/lists
-    return Response(serializer.data)
-
-
-@api_view(['POST'])
-def create_user(request):
-    """
-    API endpoint to create a new user.
-    
-    This function handles POST requests to create new user records in the database.
-    It expects JSON data containing 'name' and 'age' fields.
-    
-    Args:
-        request: The HTTP request object containing user data in request.data
-        
-    Returns:
-        Response: 
-        - 201 Created with user data if successful
-        - 400 Bad Request with error details if validation fails
-        
-    Example request data:
-    {
-        "name": "Alice Smith", 
-        "age": 25
-    }
-    """
-    
-    # Create a serializer instance with the data from the request
-    # request.data contains the JSON data sent by the client
-    serializer = UserSerializer(data=request.data)
-    
-    # Check if the provided data is valid according to our model rules
-    # This validates field types, required fields, max lengths, etc.
-    if serializer.is_valid():
-        # If data is valid, save the new user to the database
-        # .save() creates a new User record and returns the instance
-        serializer.save()
-        
-        # Return the created user data with HTTP 201 (Created) status
-        # This tells the client the resource was successfully created
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-    
-    # If validation failed, return the errors with HTTP 400 (Bad Request)
-    # serializer.errors contains details about what went wrong
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+# Caching for the users list endpoint.
+# Rather than trying to delete every cached page on a write (the locmem
+# backend has no wildcard delete), we keep a version counter in the cache
+# and make it part of every list cache key. Bumping the counter on any
+# create/update/delete instantly orphans the stale entries, which then
+# just expire on their own.
+USERS_LIST_CACHE_TIMEOUT = 30  # seconds a cached page stays fresh
+USERS_LIST_VERSION_KEY = 'users_list_version'
+
 
+def _users_list_version():
+    """Return the current users-list cache version, initializing it to 1."""
+    return cache.get_or_set(USERS_LIST_VERSION_KEY, 1, timeout=None)
 
-## CRUD Operations - Complete Create, Read, Update, Delete functionality
 
-@api_view(['GET', 'PUT', 'DELETE'])
-def user_detail(request, user_id):
+def _invalidate_users_list_cache():
+    """Bump the version counter so cached list pages stop being served."""
+    try:
+        cache.incr(USERS_LIST_VERSION_KEY)
+    except ValueError:
+        # The counter was evicted or never set — any fresh value works
+        cache.set(USERS_LIST_VERSION_KEY, 1, timeout=None)
+
+
+class UserViewSet(viewsets.ModelViewSet):
     """
-    API endpoint to handle individual user operations.
-    
-    This function handles three different HTTP methods for a specific user:
-    - GET: Retrieve user details
-    - PUT: Update user information  
-    - DELETE: Remove user from database
-    
-    Args:
-        request: The HTTP request object
-        user_id: The ID of the user to operate on (extracted from URL)
-        
-    Returns:
-        Response: Different responses based on the HTTP method used
-        
-    URL pattern: /api/users/1/ (where 1 is the user_id)
+    One ViewSet replacing the old get_users/create_user/user_detail functions.
+
+    ModelViewSet provides the full CRUD set through a single class that the
+    router wires up automatically:
+
+    - GET    /api/users/        → list()     → Paginated list of users
+    - POST   /api/users/        → create()   → Create a new user
+    - GET    /api/users/<id>/   → retrieve() → Get one user
+    - PUT    /api/users/<id>/   → update()   → Update a user
+    - PATCH  /api/users/<id>/   → partial_update() → Update some fields
+    - DELETE /api/users/<id>/   → destroy()  → Delete a user
+
+    Besides removing duplicated boilerplate, the class-based dispatch lets
+    DRF reuse its renderer/parser/content-negotiation setup across actions
+    instead of rebuilding it inside each @api_view wrapper, and pagination,
+    throttling and filtering hooks all plug in without extra code.
     """
-    
-    try:
-        # Try to find the user with the given ID in the database
-        # User.objects.get() raises an exception if user doesn't exist
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        # If user doesn't exist, return HTTP 404 (Not Found)
-        # This is a standard response when a resource cannot be found
-        return Response(status=status.HTTP_404_NOT_FOUND)
-
-    # Handle different HTTP methods using if-elif-else structure
-    
-    if request.method == 'GET':
+
+    # Base queryset for the detail actions: select only the columns the API
+    # exposes (.only keeps the SELECT list narrow as the model grows) in
+    # stable primary-key order
+    queryset = User.objects.only('id', 'name', 'age').order_by('id')
+    serializer_class = UserSerializer
+
+    def get_object(self):
         """
-        GET request: Return user information
-        Used when client wants to retrieve details of a specific user
+        Fetch the user for a detail action without exception-driven lookup.
+
+        The stock get_object() goes through get_object_or_404, which wraps
+        a .get() call in try/except DoesNotExist — exception machinery on
+        the hot path of every detail request. .first() returns None on a
+        miss instead, so the found case is a plain call with no exception
+        frame, and only the genuinely rare miss raises (NotFound, which
+        DRF turns into the usual 404 response).
         """
-        # Convert the user object to JSON format using our serializer
-        serializer = UserSerializer(user)
-        # Return the user data as JSON response
-        return Response(serializer.data)
+        user = self.get_queryset().filter(pk=self.kwargs['pk']).first()
+        if user is None:
+            raise NotFound()
+        self.check_object_permissions(self.request, user)
+        return user
 
-    elif request.method == 'PUT':
+    def list(self, request, *args, **kwargs):
         """
-        PUT request: Update user information
-        Used when client wants to modify existing user data
-        Expects JSON data with fields to update
+        Return one page of users, served from the cache when possible.
+
+        Serves repeat requests for the same page from the cache for
+        USERS_LIST_CACHE_TIMEOUT seconds, skipping the database query,
+        pagination and response building entirely. The full request path
+        keeps different ?page= values in separate cache slots.
         """
-        # Create serializer with existing user instance and new data
-        # This tells Django to update the existing user rather than create new one
-        serializer = UserSerializer(user, data=request.data)
-        
-        # Validate the new data
-        if serializer.is_valid():
-            # If valid, save the changes to the database
-            serializer.save()
-            # Return the updated user data
-            return Response(serializer.data)
-        
-        # If validation failed, return error details
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    elif request.method == 'DELETE':
+        cache_key = f'users_list:v{_users_list_version()}:{request.get_full_path()}'
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return Response(cached_data)
+
+        # Fetch the rows as plain dictionaries with .values() instead of
+        # full User instances: the payload is just (id, name, age), so
+        # model __init__ plus the serializer's per-field loop would
+        # allocate several Python objects per row for no benefit.
+        users = User.objects.values('id', 'name', 'age').order_by('id')
+
+        # paginate_queryset/get_paginated_response use the pagination class
+        # configured in settings.REST_FRAMEWORK (PageNumberPagination)
+        page = self.paginate_queryset(users)
+        response = self.get_paginated_response(page)
+
+        # Remember this page for subsequent identical requests
+        cache.set(cache_key, response.data, USERS_LIST_CACHE_TIMEOUT)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
         """
-        DELETE request: Remove user from database
-        Used when client wants to permanently delete a user
+        Return one user, honoring conditional GET via ETag/If-None-Match.
+
+        The ETag is a hash of everything in the response body, so a client
+        (or polling job) that sends back the ETag it last saw gets a
+        0-byte 304 when the user hasn't changed — no serialization, no
+        JSON encode, no payload on the wire.
         """
-        # Delete the user from the database
-        # This permanently removes the record
-        user.delete()
-        
-        # Return HTTP 204 (No Content) - successful deletion with no response body
-        # This is the standard response for successful DELETE operations
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        user = self.get_object()
+
+        # Hash the full response content into an opaque, quoted ETag value
+        fingerprint = f'{user.id}:{user.name}:{user.age}'.encode()
+        etag = f'"{hashlib.md5(fingerprint).hexdigest()}"'
+
+        # If the client already has this exact version, skip the body
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+
+        serializer = self.get_serializer(user)
+        response = Response(serializer.data)
+        response['ETag'] = etag
+        return response
+
+    def perform_create(self, serializer):
+        """Save the new user, then drop the now-stale cached list pages."""
+        serializer.save()
+        _invalidate_users_list_cache()
+
+    def perform_update(self, serializer):
+        """Save the changes, then drop the now-stale cached list pages."""
+        serializer.save()
+        _invalidate_users_list_cache()
+
+    def perform_destroy(self, instance):
+        """Delete the user, then drop the now-stale cached list pages."""
+        instance.delete()
+        _invalidate_users_list_cache()